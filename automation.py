@@ -1,100 +1,233 @@
 from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QPushButton, 
                              QLabel, QFileDialog, QTextEdit, QHBoxLayout, QFrame,
                              QMessageBox, QProgressBar, QSplitter)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve, QEvent, QSize, QTimer, QObject
-from PyQt6.QtGui import QPalette, QColor, QIcon
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve, QEvent, QTimer, QObject
+from PyQt6.QtGui import QPalette, QColor, QTextCursor
 import shutil
+import errno
+import functools
 import os
+import queue
+import threading
 import time
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, List
+from dataclasses import dataclass, field
+from typing import Callable, ClassVar, Optional, Dict, List, Tuple
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.observers.api import ObservedWatch
+from watchdog.events import PatternMatchingEventHandler
 
 from styles import apply_stylesheet
 from config import Config
 from logger import FileOrganizerLogger
 
-class FileHandler(QObject, FileSystemEventHandler):
-    """Enhanced file system event handler with better error handling."""
-    
-    file_moved = pyqtSignal(str, str)
-    file_error = pyqtSignal(str, str)
-
-    def __init__(self, source_folder: str, config: Config, logger: FileOrganizerLogger):
-        super().__init__()
-        self.source_folder = Path(source_folder)
-        self.config = config
-        self.logger = logger
+# A single observer (one inotify instance / watcher thread) shared by all monitors
+_OBSERVER: Optional[Observer] = None
+_OBSERVER_LOCK = threading.RLock()
+
+# Handlers attached to each watch. ObservedWatch compares by path, so monitors on the
+# same folder share one watch, which may only be unscheduled once all have detached.
+_WATCH_HANDLER_COUNTS: Dict[ObservedWatch, int] = {}
+
+# Hidden and temporary (e.g. Office lock) files are never organized: watchdog filters
+# them before dispatch, and the existing-files scan skips them by name prefix
+_IGNORED_PREFIXES = (".", "~")
+
+def _get_observer() -> Observer:
+    """Return the shared observer, starting it on first use."""
+    global _OBSERVER
+    with _OBSERVER_LOCK:
+        if _OBSERVER is None:
+            _OBSERVER = Observer()
+            _OBSERVER.start()
+        return _OBSERVER
+
+def _schedule_handler(event_handler, path: str) -> ObservedWatch:
+    """Attach an event handler to the shared observer's watch for path."""
+    with _OBSERVER_LOCK:
+        watch = _get_observer().schedule(event_handler, path, recursive=False)
+        _WATCH_HANDLER_COUNTS[watch] = _WATCH_HANDLER_COUNTS.get(watch, 0) + 1
+        return watch
+
+def _unschedule_handler(event_handler, watch: ObservedWatch) -> None:
+    """Detach an event handler, unscheduling its watch once no handlers remain."""
+    with _OBSERVER_LOCK:
+        _OBSERVER.remove_handler_for_watch(event_handler, watch)
+        remaining = _WATCH_HANDLER_COUNTS.pop(watch) - 1
+        if remaining:
+            _WATCH_HANDLER_COUNTS[watch] = remaining
+        else:
+            _OBSERVER.unschedule(watch)
 
-    def on_created(self, event):
-        """Handle file creation events."""
-        if event.is_directory:
-            return
-            
-        file_path = Path(event.src_path)
-        
-        # Wait a bit to ensure file is fully written
-        time.sleep(0.1)
-        
-        if not file_path.exists():
-            return
-            
-        self._organize_file(file_path)
+@functools.lru_cache(maxsize=1024)
+def _norm_ext(suffix: str) -> str:
+    """Normalize a file extension for category lookup."""
+    return sys.intern(suffix.lower())
 
-    def _organize_file(self, file_path: Path) -> bool:
+@dataclass
+class FileOrganizer:
+    """Moves files from a source folder into their category subfolders."""
+    
+    source_folder: Path
+    ext_map: Dict[str, str]
+    logger: FileOrganizerLogger
+    on_moved: Optional[Callable[[str, str], None]] = None
+    on_error: Optional[Callable[[str, str], None]] = None
+    
+    # Category folders already created, so each is built and mkdir'd only once
+    _dest_cache: Dict[str, Path] = field(default_factory=dict, init=False, repr=False)
+    
+    # Seconds to wait between attempts when a move fails on a busy file
+    MOVE_RETRY_DELAYS: ClassVar[Tuple[float, ...]] = (0.001, 0.005, 0.02, 0.05, 0.1)
+    
+    @classmethod
+    def from_config(cls, source_folder: str, config: Config, logger: FileOrganizerLogger,
+                    on_moved: Optional[Callable[[str, str], None]] = None,
+                    on_error: Optional[Callable[[str, str], None]] = None) -> "FileOrganizer":
+        """Create an organizer using the config's extension index."""
+        # Config rebuilds this dict in place, so the reference stays current
+        return cls(Path(source_folder), config._ext_to_category, logger, on_moved, on_error)
+    
+    def organize_file(self, file_path: Path) -> bool:
         """Organize a single file into appropriate category."""
+        category = self.get_file_category(_norm_ext(file_path.suffix))
+        if not category:
+            return False
+        return self.move_to_category(file_path, category)
+    
+    def move_to_category(self, file_path: Path, category: str,
+                         dest_folder: Optional[Path] = None) -> bool:
+        """Move a file into its category folder, creating it unless given."""
+        file_name = file_path.name
         try:
-            file_ext = file_path.suffix.lower()
-            file_name = file_path.name
-            
-            # Skip hidden files and system files
-            if file_name.startswith('.') or file_name.startswith('~'):
-                return False
-            
-            category = self._get_file_category(file_ext)
-            if not category:
-                return False
-                
-            dest_folder = self.source_folder / category
-            dest_folder.mkdir(exist_ok=True)
-            
-            # Handle duplicate files
-            dest_path = self._get_unique_path(dest_folder / file_name)
+            if dest_folder is None:
+                dest_folder = self.get_dest_folder(category)
             
-            shutil.move(str(file_path), str(dest_path))
-            self.file_moved.emit(file_name, category)
+            # Files still being written can be locked (Windows) or not yet visible;
+            # retry briefly instead of delaying every file up front
+            for delay in self.MOVE_RETRY_DELAYS + (None,):
+                try:
+                    self._move_file(file_path, dest_folder)
+                    break
+                except (PermissionError, FileNotFoundError):
+                    if delay is None:
+                        raise
+                    if not dest_folder.is_dir():
+                        # Category folder was removed after it was cached
+                        self._dest_cache.pop(category, None)
+                        dest_folder = self.get_dest_folder(category)
+                    time.sleep(delay)
+            if self.on_moved:
+                self.on_moved(file_name, category)
             self.logger.success(f"Moved: {file_name} → {category}", emit_signal=False)
             return True
             
         except Exception as e:
-            error_msg = f"Error moving {file_path.name}: {str(e)}"
-            self.file_error.emit(file_path.name, error_msg)
+            error_msg = f"Error moving {file_name}: {str(e)}"
+            if self.on_error:
+                self.on_error(file_name, error_msg)
             self.logger.error(error_msg, emit_signal=False)
             return False
     
-    def _get_file_category(self, file_ext: str) -> Optional[str]:
+    def get_file_category(self, file_ext: str) -> Optional[str]:
         """Get the category for a file extension."""
-        for category, extensions in self.config.file_categories.items():
-            if file_ext in extensions:
-                return category
-        return None
+        return self.ext_map.get(file_ext)
     
-    def _get_unique_path(self, path: Path) -> Path:
-        """Get a unique file path to avoid overwrites."""
-        if not path.exists():
-            return path
-            
-        stem = path.stem
-        suffix = path.suffix
+    def get_dest_folder(self, category: str) -> Path:
+        """Get the folder for a category, creating it on first use."""
+        dest_folder = self._dest_cache.get(category)
+        if dest_folder is None:
+            dest_folder = self.source_folder / category
+            dest_folder.mkdir(exist_ok=True)
+            self._dest_cache[category] = dest_folder
+        return dest_folder
+    
+    def _move_file(self, file_path: Path, dest_folder: Path) -> Path:
+        """Move a file into dest_folder, adding a counter suffix instead of overwriting."""
+        stem = file_path.stem
+        suffix = file_path.suffix
+        dest_path = dest_folder / file_path.name
+        cross_device = False
         counter = 1
         
-        while path.exists():
-            path = path.parent / f"{stem}_{counter}{suffix}"
-            counter += 1
-            
-        return path
+        # Each attempt fails with FileExistsError rather than overwriting, so no
+        # stat is needed per candidate name and the common case succeeds first try.
+        # Copying is only tried once linking/renaming reports a cross-device move.
+        while True:
+            try:
+                if not cross_device:
+                    try:
+                        if os.name == 'nt':
+                            os.rename(file_path, dest_path)
+                        else:
+                            self._link_exclusive(file_path, dest_path)
+                        return dest_path
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        cross_device = True
+                self._copy_exclusive(file_path, dest_path)
+                self._remove_source(file_path, dest_path)
+                return dest_path
+            except FileExistsError:
+                dest_path = dest_folder / f"{stem}_{counter}{suffix}"
+                counter += 1
+    
+    @classmethod
+    def _link_exclusive(cls, src: Path, dest: Path) -> None:
+        """Rename src to dest on POSIX, failing if dest already exists."""
+        try:
+            os.link(src, dest)
+        except FileExistsError:
+            raise
+        except OSError as e:
+            if e.errno == errno.EXDEV:
+                raise
+            # Filesystem without hard link support
+            if dest.exists():
+                raise FileExistsError(errno.EEXIST, "File exists", str(dest))
+            os.rename(src, dest)
+            return
+        cls._remove_source(src, dest)
+    
+    @staticmethod
+    def _copy_exclusive(src: Path, dest: Path) -> None:
+        """Copy src to dest across devices, failing if dest already exists."""
+        with open(src, 'rb') as fsrc, open(dest, 'xb') as fdst:
+            shutil.copyfileobj(fsrc, fdst)
+        shutil.copystat(src, dest)
+    
+    @staticmethod
+    def _remove_source(src: Path, dest: Path) -> None:
+        """Remove src once dest holds its data, undoing dest if that fails."""
+        try:
+            os.unlink(src)
+        except OSError:
+            # Leave the file where it was rather than a second copy under dest
+            os.unlink(dest)
+            raise
+
+class FileHandler(QObject, PatternMatchingEventHandler):
+    """Enhanced file system event handler with better error handling."""
+    
+    file_moved = pyqtSignal(str, str)
+    file_error = pyqtSignal(str, str)
+    
+    def __init__(self, source_folder: str, config: Config, logger: FileOrganizerLogger):
+        super().__init__(ignore_patterns=[f"{prefix}*" for prefix in _IGNORED_PREFIXES],
+                         ignore_directories=True, case_sensitive=False)
+        self.organizer = FileOrganizer.from_config(
+            source_folder, config, logger,
+            on_moved=self.file_moved.emit, on_error=self.file_error.emit
+        )
+        self.pending_events: queue.Queue = queue.Queue()
+
+    def on_created(self, event):
+        """Queue file creation events for the monitor thread to organize."""
+        self.pending_events.put(event.src_path)
 
 class FolderMonitor(QThread):
     """Enhanced folder monitoring thread with better error handling."""
@@ -109,8 +242,9 @@ class FolderMonitor(QThread):
         self.source_folder = source_folder
         self.config = config
         self.logger = logger
-        self.stop_event = False
-        self.observer = None
+        self.stop_event = threading.Event()
+        self.watch = None
+        self.event_handler = None
 
     def run(self):
         """Main monitoring loop."""
@@ -118,33 +252,56 @@ class FolderMonitor(QThread):
             self.logger.info(f"Starting monitor for {self.source_folder}", emit_signal=False)
             
             event_handler = FileHandler(self.source_folder, self.config, self.logger)
+            self.event_handler = event_handler
             event_handler.file_moved.connect(self.file_moved)
             event_handler.file_error.connect(self.file_error)
             
-            self.observer = Observer()
-            self.observer.schedule(event_handler, self.source_folder, recursive=False)
-            self.observer.start()
+            self.watch = _schedule_handler(event_handler, self.source_folder)
             
             self.monitoring_started.emit()
             
-            while not self.stop_event:
-                time.sleep(0.5)  # More responsive stopping
+            self._process_events(event_handler)
                 
         except Exception as e:
             self.logger.error(f"Monitor error: {str(e)}", emit_signal=False)
         finally:
-            if self.observer:
-                self.observer.stop()
-                self.observer.join()
+            if self.watch:
+                _unschedule_handler(self.event_handler, self.watch)
+                self.watch = None
             self.monitoring_stopped.emit()
             self.logger.info("Monitor stopped", emit_signal=False)
 
+    def _process_events(self, event_handler: FileHandler):
+        """Drain queued events in batches, organizing each path once per batch."""
+        events = event_handler.pending_events
+        
+        while not self.stop_event.is_set():
+            # Block until an event arrives or stop() wakes us
+            path = events.get()
+            
+            # Repeated events for the same path collapse into one entry
+            pending: Dict[str, None] = {}
+            while path is not None:
+                pending[path] = None
+                try:
+                    path = events.get_nowait()
+                except queue.Empty:
+                    path = None
+            
+            for path in pending:
+                if self.stop_event.is_set():
+                    break
+                file_path = Path(path)
+                if file_path.exists():
+                    event_handler.organizer.organize_file(file_path)
+
     def stop(self):
         """Stop the monitoring thread gracefully."""
         self.logger.info("Stopping monitor...", emit_signal=False)
-        self.stop_event = True
-        if self.observer:
-            self.observer.stop()
+        self.stop_event.set()
+        if self.event_handler:
+            # Wake the event loop if it is blocked on an empty queue
+            self.event_handler.pending_events.put(None)
 
 class FileOrganizerApp(QWidget):
     """Enhanced File Organizer application with improved architecture."""
@@ -160,7 +317,9 @@ class FileOrganizerApp(QWidget):
         # Application state
         self.source_folder = None
         self.worker = None
+        self._organizer: Optional[FileOrganizer] = None
         self.is_dark_mode = False
+        self._log_buffer: List[str] = []
         
         self._setup_ui()
         self._setup_connections()
@@ -193,8 +352,6 @@ class FileOrganizerApp(QWidget):
         
         self.toggle_dark_mode_button = QPushButton()
         self.toggle_dark_mode_button.setObjectName("toggleDarkModeButton")
-        self.toggle_dark_mode_button.setIcon(QIcon("icons/sun-line.png"))
-        self.toggle_dark_mode_button.setIconSize(QSize(24, 24))
         self.top_layout.addWidget(self.toggle_dark_mode_button)
         self.layout.addLayout(self.top_layout)
 
@@ -202,6 +359,7 @@ class FileOrganizerApp(QWidget):
         self.log_output = QTextEdit()
         self.log_output.setObjectName("logOutput")
         self.log_output.setReadOnly(True)
+        self.log_output.setAcceptRichText(False)
         self.log_output.document().setMaximumBlockCount(ui_settings["log_max_lines"])
         self.layout.addWidget(self.log_output)
 
@@ -254,8 +412,24 @@ class FileOrganizerApp(QWidget):
         self.log_animation.setDuration(duration)
         self.log_animation.setEasingCurve(QEasingCurve.Type.OutQuad)
 
-        # Install event filters for hover animations
+        self.log_fade_animation = QPropertyAnimation(self.log_output, b"windowOpacity")
+        self.log_fade_animation.setDuration(300)
+        self.log_fade_animation.setStartValue(0.5)
+        self.log_fade_animation.setEndValue(1)
+        self.log_fade_animation.setEasingCurve(QEasingCurve.Type.OutQuad)
+
+        # Hover animations are created once per button and reused on every event
+        self._hover_anims = {}
         for button in self.buttons + [self.toggle_dark_mode_button]:
+            anim = QPropertyAnimation(button, b"geometry", self)
+            anim.setDuration(200)
+            anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+            
+            scale_anim = QPropertyAnimation(button, b"minimumWidth", self)
+            scale_anim.setDuration(200)
+            scale_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+            
+            self._hover_anims[id(button)] = (anim, scale_anim)
             button.installEventFilter(self)
 
     def start_fade_in(self):
@@ -274,33 +448,25 @@ class FileOrganizerApp(QWidget):
         mode_transition.start()
 
     def eventFilter(self, obj, event):
-        if obj in [self.select_button, self.start_button, self.stop_button, self.view_logs_button, self.toggle_dark_mode_button]:
-            if event.type() == QEvent.Type.Enter:
-                anim = QPropertyAnimation(obj, b"geometry")
-                anim.setDuration(200)
-                anim.setStartValue(obj.geometry())
-                anim.setEndValue(obj.geometry().adjusted(0, 0, 0, -5))
-                anim.setEasingCurve(QEasingCurve.Type.OutQuad)
-                anim.start()
-
-                scale_anim = QPropertyAnimation(obj, b"minimumWidth")
-                scale_anim.setDuration(200)
-                scale_anim.setStartValue(obj.minimumWidth())
-                scale_anim.setEndValue(obj.minimumWidth() * 1.05)
-                scale_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
-                scale_anim.start()
-            elif event.type() == QEvent.Type.Leave:
-                anim = QPropertyAnimation(obj, b"geometry")
-                anim.setDuration(200)
+        hover_anims = self._hover_anims.get(id(obj))
+        if hover_anims is not None:
+            event_type = event.type()
+            if event_type in (QEvent.Type.Enter, QEvent.Type.Leave):
+                anim, scale_anim = hover_anims
+                anim.stop()
+                scale_anim.stop()
+                
+                if event_type == QEvent.Type.Enter:
+                    height_delta, scale = -5, 1.05
+                else:
+                    height_delta, scale = 5, 1 / 1.05
+                
                 anim.setStartValue(obj.geometry())
-                anim.setEndValue(obj.geometry().adjusted(0, 0, 0, 5))
-                anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+                anim.setEndValue(obj.geometry().adjusted(0, 0, 0, height_delta))
                 anim.start()
-
-                scale_anim = QPropertyAnimation(obj, b"minimumWidth")
-                scale_anim.setDuration(200)
+                
                 scale_anim.setStartValue(obj.minimumWidth())
-                scale_anim.setEndValue(obj.minimumWidth() / 1.05)
+                scale_anim.setEndValue(int(obj.minimumWidth() * scale))
                 scale_anim.start()
         return super().eventFilter(obj, event)
 
@@ -317,27 +483,55 @@ class FileOrganizerApp(QWidget):
             
             # Show folder statistics
             try:
-                files_count = len([f for f in Path(folder).iterdir() if f.is_file()])
+                with os.scandir(folder) as entries:
+                    files_count = sum(1 for entry in entries if entry.is_file())
                 self.logger.info(f"Found {files_count} files to organize")
             except Exception as e:
                 self.logger.error(f"Error reading folder: {str(e)}")
 
+    def _get_organizer(self) -> FileOrganizer:
+        """Return the organizer for the selected folder, reusing it across scans."""
+        if self._organizer is None or self._organizer.source_folder != Path(self.source_folder):
+            self._organizer = FileOrganizer.from_config(self.source_folder, self.config, self.logger)
+        return self._organizer
+
     def organize_existing_files(self):
         """Organize existing files in the selected folder using the new system."""
         if not self.source_folder:
             return
             
         self.logger.info("🗂️ Organizing existing files...")
-        source_path = Path(self.source_folder)
         
-        # Create a temporary file handler for organizing existing files
-        file_handler = FileHandler(self.source_folder, self.config, self.logger)
+        organizer = self._get_organizer()
         
-        organized_count = 0
-        for file_path in source_path.iterdir():
-            if file_path.is_file():
-                if file_handler._organize_file(file_path):
-                    organized_count += 1
+        # Single scandir pass grouping files by category; entries are collected
+        # before moving since organizing adds folders to the directory, and
+        # DirEntry.is_file() uses the cached d_type instead of another stat
+        ext_map = organizer.ext_map
+        groups: Dict[str, List[os.DirEntry]] = defaultdict(list)
+        with os.scandir(organizer.source_folder) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith(_IGNORED_PREFIXES):
+                    category = ext_map.get(_norm_ext(os.path.splitext(entry.name)[1]))
+                    if category:
+                        groups[category].append(entry)
+        
+        # Moves are independent and IO-bound, so a small pool overlaps the syscalls
+        max_workers = min(8, os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for category, category_entries in groups.items():
+                try:
+                    dest_folder = organizer.get_dest_folder(category)
+                except OSError as e:
+                    self.logger.error(f"Error creating folder {category}: {str(e)}")
+                    continue
+                futures.extend(
+                    executor.submit(organizer.move_to_category,
+                                    Path(entry.path), category, dest_folder)
+                    for entry in category_entries
+                )
+            organized_count = sum(1 for future in as_completed(futures) if future.result())
         
         self.logger.info(f"Organized {organized_count} existing files")
 
@@ -401,8 +595,33 @@ class FileOrganizerApp(QWidget):
         self.apply_stylesheet()
 
     def _update_log_display(self, message: str):
-        """Update the log display with new messages."""
-        self.log_output.append(message)
+        """Queue a message for the log display, flushing in batches."""
+        if not self._log_buffer:
+            QTimer.singleShot(50, self._flush_logs)
+        self._log_buffer.append(message)
+
+    def _flush_logs(self):
+        """Append all buffered messages with a single relayout and animation."""
+        if not self._log_buffer:
+            return
+        scroll_bar = self.log_output.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        
+        # Insert plain text blocks directly instead of append()'s rich text parsing
+        self.log_output.setUpdatesEnabled(False)
+        cursor = QTextCursor(self.log_output.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for message in self._log_buffer:
+            if not self.log_output.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(message)
+        cursor.endEditBlock()
+        self._log_buffer.clear()
+        self.log_output.setUpdatesEnabled(True)
+        
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
         self.animate_log_with_fade()
 
     def _on_file_moved(self, file_name: str, category: str):
@@ -421,18 +640,15 @@ class FileOrganizerApp(QWidget):
         self.log_animation.setEndValue(self.log_output.height() + 20)
         self.log_animation.start()
 
-        log_fade = QPropertyAnimation(self.log_output, b"windowOpacity")
-        log_fade.setDuration(300)
-        log_fade.setStartValue(0.5)
-        log_fade.setEndValue(1)
-        log_fade.setEasingCurve(QEasingCurve.Type.OutQuad)
-        log_fade.start()
+        self.log_fade_animation.stop()
+        self.log_fade_animation.start()
 
     def closeEvent(self, event):
         """Handle application close event."""
         if self.worker and self.worker.isRunning():
             self.worker.stop()
             self.worker.wait()
+        self.logger.close()
         event.accept()
 
 if __name__ == "__main__":
@@ -1,23 +1,28 @@
 # config.py
 """Configuration management for the File Organizer application."""
 
+import copy
 import json
 import os
-from typing import Dict, List, Optional
+import sys
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+# Parsed config files keyed by absolute path, with the (mtime_ns, size) they were read at
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
 
 class Config:
     """Manages application configuration and file categories."""
     
     DEFAULT_CONFIG = {
         "file_categories": {
-            "Images": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp"],
-            "Documents": [".pdf", ".docx", ".txt", ".doc", ".rtf", ".odt"],
-            "Videos": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"],
-            "Audio": [".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma"],
-            "Executables": [".exe", ".msi", ".deb", ".dmg"],
-            "Archives": [".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"],
-            "Code": [".py", ".js", ".html", ".css", ".cpp", ".java", ".c"],
-            "Spreadsheets": [".xlsx", ".xls", ".csv", ".ods"]
+            "Images": frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp"}),
+            "Documents": frozenset({".pdf", ".docx", ".txt", ".doc", ".rtf", ".odt"}),
+            "Videos": frozenset({".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"}),
+            "Audio": frozenset({".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma"}),
+            "Executables": frozenset({".exe", ".msi", ".deb", ".dmg"}),
+            "Archives": frozenset({".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"}),
+            "Code": frozenset({".py", ".js", ".html", ".css", ".cpp", ".java", ".c"}),
+            "Spreadsheets": frozenset({".xlsx", ".xls", ".csv", ".ods"})
         },
         "ui_settings": {
             "window_width": 600,
@@ -30,40 +35,76 @@ class Config:
     def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
         self.config = self._load_config()
+        self._ext_to_category: Dict[str, str] = {}
+        self._build_ext_index()
     
     def _load_config(self) -> Dict:
         """Load configuration from file or create default."""
+        config = self.DEFAULT_CONFIG.copy()
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                config = self._read_config_file()
             except (json.JSONDecodeError, IOError):
                 pass
-        return self.DEFAULT_CONFIG.copy()
+        
+        # Store extensions as frozensets for O(1) membership tests
+        categories = config.get("file_categories", self.DEFAULT_CONFIG["file_categories"])
+        config["file_categories"] = {
+            name: frozenset(extensions) for name, extensions in categories.items()
+        }
+        return config
+    
+    def _read_config_file(self) -> Dict:
+        """Parse the config file, reusing the previous parse if it is unchanged."""
+        path = os.path.abspath(self.config_file)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = _CONFIG_CACHE.get(path)
+        if cached is None or cached[0] != version:
+            with open(path, 'r') as f:
+                cached = (version, json.load(f))
+            _CONFIG_CACHE[path] = cached
+        return copy.deepcopy(cached[1])
+    
+    def _build_ext_index(self) -> None:
+        """Rebuild the extension to category lookup table in place."""
+        self._ext_to_category.clear()
+        for category, extensions in self.file_categories.items():
+            for ext in extensions:
+                # Interned keys let lookups with interned extensions match by identity
+                self._ext_to_category.setdefault(sys.intern(ext), category)
     
     def save_config(self) -> None:
         """Save current configuration to file."""
         try:
+            data = dict(self.config)
+            data["file_categories"] = {
+                name: sorted(extensions)
+                for name, extensions in self.config["file_categories"].items()
+            }
             with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+                json.dump(data, f, indent=2)
         except IOError as e:
             print(f"Failed to save config: {e}")
     
     @property
-    def file_categories(self) -> Dict[str, List[str]]:
+    def file_categories(self) -> Dict[str, FrozenSet[str]]:
         return self.config.get("file_categories", self.DEFAULT_CONFIG["file_categories"])
     
     @property
     def ui_settings(self) -> Dict:
         return self.config.get("ui_settings", self.DEFAULT_CONFIG["ui_settings"])
     
-    def add_category(self, name: str, extensions: List[str]) -> None:
+    def add_category(self, name: str, extensions: Iterable[str]) -> None:
         """Add a new file category."""
-        self.config["file_categories"][name] = extensions
+        self.config["file_categories"][name] = frozenset(extensions)
+        self._build_ext_index()
         self.save_config()
     
     def remove_category(self, name: str) -> None:
         """Remove a file category."""
         if name in self.config["file_categories"]:
             del self.config["file_categories"][name]
+            self._build_ext_index()
             self.save_config()
\ No newline at end of file
@@ -2,11 +2,30 @@
 """Enhanced logging system for the File Organizer application."""
 
 import logging
-import os
-from datetime import datetime
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 from PyQt6.QtCore import QObject, pyqtSignal
 
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records in the same second."""
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        self._last_secs = None
+        self._last_str = ""
+    
+    def formatTime(self, record, datefmt=None):
+        secs = int(record.created)
+        if secs != self._last_secs:
+            self._last_str = time.strftime(datefmt or self.default_time_format,
+                                           self.converter(record.created))
+            self._last_secs = secs
+        if datefmt:
+            return self._last_str
+        return self.default_msec_format % (self._last_str, record.msecs)
+
 class FileOrganizerLogger(QObject):
     """Custom logger with GUI integration."""
     
@@ -15,30 +34,47 @@ class FileOrganizerLogger(QObject):
     def __init__(self, log_file: str = "file_organizer.log"):
         super().__init__()
         self.log_file = log_file
+        self._listener = None
         self._setup_logger()
     
     def _setup_logger(self):
-        """Setup file and console logging."""
+        """Setup file and console logging on a background listener thread."""
         self.logger = logging.getLogger("FileOrganizer")
         self.logger.setLevel(logging.INFO)
         
         # Clear existing handlers
+        self.close()
         self.logger.handlers.clear()
         
-        # File handler
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
-        file_formatter = logging.Formatter(
+        # File handler, rotated so the log stays bounded in size
+        file_handler = RotatingFileHandler(
+            self.log_file, maxBytes=5_000_000, backupCount=5, encoding='utf-8'
+        )
+        file_formatter = CachedTimeFormatter(
             '%(asctime)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
         
         # Console handler
         console_handler = logging.StreamHandler()
         console_formatter = logging.Formatter('%(levelname)s: %(message)s')
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        
+        # Callers only enqueue records; the listener thread does the actual writes
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._listener = QueueListener(log_queue, file_handler, console_handler)
+        self._listener.start()
+    
+    def close(self):
+        """Flush queued records and release the log handlers."""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._listener = None
     
     def info(self, message: str, emit_signal: bool = True):
         """Log info message."""
@@ -63,18 +99,3 @@ class FileOrganizerLogger(QObject):
         self.logger.error(message)
         if emit_signal:
             self.log_updated.emit(f"❌ {message}")
-    
-    def clear_old_logs(self, days: int = 30):
-        """Clear log entries older than specified days."""
-        if not os.path.exists(self.log_file):
-            return
-        
-        try:
-            # This is a simple implementation - in production you might want
-            # to use log rotation instead
-            file_age = datetime.now().timestamp() - os.path.getmtime(self.log_file)
-            if file_age > (days * 24 * 3600):  # Convert days to seconds
-                os.remove(self.log_file)
-                self._setup_logger()
-        except OSError:
-            pass
\ No newline at end of file
@@ -38,7 +38,8 @@ def main():
         sys.exit(1)
     
     # Check if icons directory exists
-    if not os.path.exists("icons"):
+    icons_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+    if not os.path.exists(icons_dir):
         print("Warning: Icons directory not found. Some UI elements may not display correctly.")
     
     # Import and run the application
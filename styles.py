@@ -1,171 +1,157 @@
 # styles.py
 """Enhanced styling system for the File Organizer application."""
 
+import functools
+import os
+import re
+
 from PyQt6.QtGui import QIcon, QFont
-from PyQt6.QtCore import QSize
+from PyQt6.QtCore import QDir, QSize
+
+# Resolve "icons:" paths against the bundled icons directory, independent of the cwd.
+# PyQt6 dropped pyrcc/.qrc support; search paths are its replacement.
+QDir.addSearchPath("icons", os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons"))
+
+# Layout, typography and accent rules shared by both themes
+_BASE_RAW = """
+    QWidget {
+        font-family: 'Inter', 'Segoe UI', Arial, sans-serif;
+        font-size: 14px;
+    }
+    #header {
+        font-size: 28px;
+        font-weight: bold;
+        padding: 20px;
+        border-radius: 15px;
+        margin: 10px;
+    }
+    #toggleDarkModeButton {
+        background-color: transparent;
+        border-radius: 12px;
+        padding: 2px;
+        width: 40px;
+        height: 40px;
+    }
+    #logOutput {
+        border-radius: 15px;
+        padding: 15px;
+        margin: 10px;
+        font-family: 'Consolas', 'Courier New', monospace;
+    }
+    #buttonContainer {
+        border-radius: 30px;
+        padding: 10px;
+        margin: 10px;
+    }
+    #buttonContainer > QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #635BFF, stop:1 #4A47FF);  /* Gradient for depth */
+        border: 1px solid #4A47FF;  /* Subtle border to separate buttons */
+        border-radius: 30px;
+        padding: 8px 16px;
+        font-weight: bold;
+        font-size: 14px;
+        min-width: 120px;
+        margin: 5px;
+    }
+    #buttonContainer > QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #7B72FF, stop:1 #635BFF);  /* Lighter gradient on hover */
+    }
+    #buttonContainer > QPushButton:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #4A47FF, stop:1 #3A37FF);  /* Darker gradient when pressed */
+    }
+"""
+
+# Stripe-inspired dark theme colors
+_DARK_DELTA = """
+    QWidget {
+        background: #1A1A3A;  /* Stripe's dark background */
+        color: #FFFFFF;  /* White text */
+    }
+    #header {
+        color: #FFFFFF;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #1A1A3A, stop:1 #242450);  /* Gradient like Stripe */
+    }
+    #toggleDarkModeButton {
+        border: 1px solid #585B70;
+    }
+    #toggleDarkModeButton:hover {
+        background-color: #585B70;
+    }
+    #logOutput {
+        background-color: #242450;  /* Slightly lighter dark shade */
+        border: 1px solid #585B70;
+        color: #FFFFFF;
+    }
+    #buttonContainer {
+        background-color: #2E2E5A;  /* Slightly darker than buttons for contrast */
+        border: 1px solid #585B70;  /* Subtle border for separation */
+    }
+    #buttonContainer > QPushButton {
+        color: #FFFFFF;
+    }
+"""
+
+# Light theme colors (Stripe-inspired but lighter)
+_LIGHT_DELTA = """
+    QWidget {
+        background: #F5F5F5;
+        color: #1A1A3A;
+    }
+    #header {
+        color: #1A1A3A;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #E5E9F0, stop:1 #F5F5F5);
+    }
+    #toggleDarkModeButton {
+        border: 1px solid #D8DEE9;
+    }
+    #toggleDarkModeButton:hover {
+        background-color: #D8DEE9;
+    }
+    #logOutput {
+        background-color: #E5E9F0;
+        border: 1px solid #D8DEE9;
+        color: #1A1A3A;
+    }
+    #buttonContainer {
+        background-color: #D8DEE9;  /* Lighter background for contrast */
+        border: 1px solid #B0B7C4;  /* Subtle border for separation */
+    }
+    #buttonContainer > QPushButton {
+        color: #FFFFFF;  /* Buttons keep the blue gradient, so text stays light */
+    }
+"""
+
+_QSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_QSS_WHITESPACE = re.compile(r'\s+')
+
+def _minify(qss):
+    """Strip comments and collapse whitespace so Qt tokenizes less text per apply."""
+    return _QSS_WHITESPACE.sub(' ', _QSS_COMMENT.sub('', qss)).strip()
+
+_DARK_QSS = _minify(_BASE_RAW + _DARK_DELTA)
+_LIGHT_QSS = _minify(_BASE_RAW + _LIGHT_DELTA)
+
+_STYLES = {True: _DARK_QSS, False: _LIGHT_QSS}
+
+_ICON_SIZE = QSize(24, 24)
+
+@functools.lru_cache(maxsize=4)
+def _icon(path):
+    """Load an icon once per path; a QApplication must exist before the first call."""
+    return QIcon(path)
 
-def apply_stylesheet(main_window, is_dark_mode):
-    # Stripe-inspired dark theme
-    dark_stylesheet = """
-        QWidget {
-            background: #1A1A3A;  /* Stripe's dark background */
-            color: #FFFFFF;  /* White text */
-            font-family: 'Inter', 'Segoe UI', Arial, sans-serif;
-            font-size: 14px;
-        }
-        #header {
-            font-size: 28px;
-            font-weight: bold;
-            color: #FFFFFF;
-            padding: 20px;
-            text-align: center;
-            background: linear-gradient(145deg, #1A1A3A, #242450);  /* Gradient like Stripe */
-            border-radius: 15px;
-            margin: 10px;
-        }
-        #toggleDarkModeButton {
-            background-color: transparent;
-            border: 1px solid #585B70;
-            border-radius: 12px;
-            padding: 2px;
-            width: 40px;
-            height: 40px;
-        }
-        #toggleDarkModeButton:hover {
-            background-color: #585B70;
-        }
-        #logOutput {
-            background-color: #242450;  /* Slightly lighter dark shade */
-            border-radius: 15px;
-            padding: 15px;
-            border: 1px solid #585B70;
-            color: #FFFFFF;
-            margin: 10px;
-            font-family: 'Consolas', 'Courier New', monospace;
-        }
-        #buttonContainer {
-            background-color: #2E2E5A;  /* Slightly darker than buttons for contrast */
-            border-radius: 30px;
-            padding: 10px;
-            margin: 10px;
-            border: 1px solid #585B70;  /* Subtle border for separation */
-        }
-        QPushButton {
-            background: linear-gradient(145deg, #635BFF, #4A47FF);  /* Gradient for depth */
-            color: #FFFFFF;
-            border: 1px solid #4A47FF;  /* Subtle border to separate buttons */
-            border-radius: 30px;
-            padding: 8px 16px;
-            font-weight: bold;
-            font-size: 14px;
-            min-width: 120px;
-            margin: 5px;
-        }
-        QPushButton:hover {
-            background: linear-gradient(145deg, #7B72FF, #635BFF);  /* Lighter gradient on hover */
-        }
-        QPushButton:pressed {
-            background: linear-gradient(145deg, #4A47FF, #3A37FF);  /* Darker gradient when pressed */
-        }
-        QLabel {
-            color: #FFFFFF;
-            font-size: 16px;
-            padding: 5px;
-        }
-        QTextEdit {
-            background-color: #242450;
-            border-radius: 15px;
-            padding: 15px;
-            border: 1px solid #585B70;
-            color: #FFFFFF;
-            margin: 10px;
-            font-family: 'Consolas', 'Courier New', monospace;
-        }
-    """
-    # Light theme (Stripe-inspired but lighter)
-    light_stylesheet = """
-        QWidget {
-            background: #F5F5F5;
-            color: #1A1A3A;
-            font-family: 'Inter', 'Segoe UI', Arial, sans-serif;
-            font-size: 14px;
-        }
-        #header {
-            font-size: 28px;
-            font-weight: bold;
-            color: #1A1A3A;
-            padding: 20px;
-            text-align: center;
-            background: linear-gradient(145deg, #E5E9F0, #F5F5F5);
-            border-radius: 15px;
-            margin: 10px;
-        }
-        #toggleDarkModeButton {
-            background-color: transparent;
-            border: 1px solid #D8DEE9;
-            border-radius: 12px;
-            padding: 2px;
-            width: 40px;
-            height: 40px;
-        }
-        #toggleDarkModeButton:hover {
-            background-color: #D8DEE9;
-        }
-        #logOutput {
-            background-color: #E5E9F0;
-            border-radius: 15px;
-            padding: 15px;
-            border: 1px solid #D8DEE9;
-            color: #1A1A3A;
-            margin: 10px;
-            font-family: 'Consolas', 'Courier New', monospace;
-        }
-        #buttonContainer {
-            background-color: #D8DEE9;  /* Lighter background for contrast */
-            border-radius: 30px;
-            padding: 10px;
-            margin: 10px;
-            border: 1px solid #B0B7C4;  /* Subtle border for separation */
-        }
-        QPushButton {
-            background: linear-gradient(145deg, #635BFF, #4A47FF);
-            color: #1453FF;
-            border: 1px solid #4A47FF;
-            border-radius: 30px;
-            padding: 8px 16px;
-            font-weight: bold;
-            font-size: 14px;
-            min-width: 120px;
-            margin: 5px;
-        }
-        QPushButton:hover {
-            background: linear-gradient(145deg, #7B72FF, #635BFF);
-        }
-        QPushButton:pressed {
-            background: linear-gradient(145deg, #4A47FF, #3A37FF);
-        }
-        QLabel {
-            color: #1A1A3A;
-            font-size: 16px;
-            padding: 5px;
-        }
-        QTextEdit {
-            background-color: #E5E9F0;
-            border-radius: 15px;
-            padding: 15px;
-            border: 1px solid #D8DEE9;
-            color: #1A1A3A;
-            margin: 10px;
-            font-family: 'Consolas', 'Courier New', monospace;
-        }
-    """
+def apply_stylesheet(target_widget, is_dark_mode):
+    """Apply the theme QSS to target_widget; only it and its children are re-polished."""
+    # Skip the QSS parse and re-polish when this theme is already applied
+    stylesheet = _STYLES[is_dark_mode]
+    if target_widget.styleSheet() == stylesheet:
+        return
 
     # Apply the appropriate stylesheet
-    main_window.setStyleSheet(dark_stylesheet if is_dark_mode else light_stylesheet)
+    target_widget.setStyleSheet(stylesheet)
 
     # Set the icon for the toggle button
-    if hasattr(main_window, "toggle_dark_mode_button"):
-        main_window.toggle_dark_mode_button.setIcon(
-            QIcon("icons/moon-line.png") if is_dark_mode else QIcon("icons/sun-line.png")
-        )
-        main_window.toggle_dark_mode_button.setIconSize(QSize(24, 24))
\ No newline at end of file
+    button = getattr(target_widget.window(), "toggle_dark_mode_button", None)
+    if button is not None:
+        button.setIcon(_icon("icons:moon-line.png") if is_dark_mode else _icon("icons:sun-line.png"))
+        button.setIconSize(_ICON_SIZE)
\ No newline at end of file
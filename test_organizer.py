@@ -1,92 +1,301 @@
 #!/usr/bin/env python3
 """
-Test script for the Smart File Organizer.
+Test suite for the Smart File Organizer.
 Creates sample files to test the organization functionality.
+
+Run with ``pytest`` or directly with ``python test_organizer.py``.
 """
 
+import errno
+import logging
 import os
+import sys
 import tempfile
+import threading
+import time
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
+
+# The app tests build widgets, which need no display with the offscreen platform
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from automation import FileOrganizer, FileOrganizerApp, FolderMonitor
 from config import Config
 from logger import FileOrganizerLogger
 
+# Scratch files go to tmpfs when available so the tests stay off the disk
+TEST_TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Sample files created by create_test_files
+TEST_FILES = (
+    "document.pdf",
+    "image.jpg",
+    "video.mp4",
+    "music.mp3",
+    "archive.zip",
+    "script.py",
+    "spreadsheet.xlsx",
+    "program.exe",
+)
+
+def _pack_payloads(filenames):
+    """Encode every sample payload into one buffer and return a slice per file."""
+    encoded = [f"Test content for {filename}".encode() for filename in filenames]
+    buffer = memoryview(b"".join(encoded))
+    slices = []
+    offset = 0
+    for data in encoded:
+        slices.append(buffer[offset:offset + len(data)])
+        offset += len(data)
+    return slices
+
+# (filename, content) pairs sharing a single preallocated buffer
+_PAYLOADS = tuple(zip(TEST_FILES, _pack_payloads(TEST_FILES)))
+
+# Gather write where available (POSIX); Windows has no os.writev
+if hasattr(os, "writev"):
+    def _write_payload(fd, data):
+        os.writev(fd, [data])
+else:
+    _write_payload = os.write
+
+# Sample files and the category each one should be organized into
+EXPECTED_CATEGORIES = [
+    ("document.pdf", "Documents"),
+    ("image.jpg", "Images"),
+    ("video.mp4", "Videos"),
+    ("music.mp3", "Audio"),
+    ("archive.zip", "Archives"),
+    ("script.py", "Code"),
+    ("spreadsheet.xlsx", "Spreadsheets"),
+    ("program.exe", "Executables"),
+]
+
 def create_test_files(test_dir):
     """Create sample files for testing."""
-    test_files = [
-        "document.pdf",
-        "image.jpg",
-        "video.mp4",
-        "music.mp3",
-        "archive.zip",
-        "script.py",
-        "spreadsheet.xlsx",
-        "program.exe"
-    ]
-    
-    for filename in test_files:
-        file_path = Path(test_dir) / filename
-        file_path.write_text(f"Test content for {filename}")
-    
-    return test_files
-
-def test_config():
-    """Test configuration system."""
-    print("Testing configuration system...")
-    config = Config()
-    
-    # Test file categories
+    for filename, data in _PAYLOADS:
+        fd = os.open(os.path.join(test_dir, filename), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _write_payload(fd, data)
+        finally:
+            os.close(fd)
+    
+    return TEST_FILES
+
+@pytest.fixture(scope="session")
+def config():
+    """Configuration loaded once and shared by every test in the session."""
+    return Config()
+
+@pytest.fixture
+def scratch_dir():
+    """Temporary directory, on tmpfs when available."""
+    with tempfile.TemporaryDirectory(dir=TEST_TMP_ROOT) as path:
+        yield path
+
+@pytest.fixture(scope="module")
+def sample_dir():
+    """Directory holding the sample files, written once for the whole module."""
+    with tempfile.TemporaryDirectory(dir=TEST_TMP_ROOT) as path:
+        create_test_files(path)
+        yield path
+
+@pytest.fixture
+def organizer_logger():
+    """Logger writing outside the folders being organized."""
+    with tempfile.TemporaryDirectory(dir=TEST_TMP_ROOT) as log_dir:
+        logger = FileOrganizerLogger(os.path.join(log_dir, "test.log"))
+        yield logger
+        logger.close()
+
+@pytest.fixture
+def organizer(scratch_dir, config, organizer_logger):
+    """Organizer for scratch_dir."""
+    return FileOrganizer.from_config(scratch_dir, config, organizer_logger)
+
+@pytest.fixture(scope="session")
+def qapp():
+    """QApplication shared by the tests that create widgets."""
+    return QApplication.instance() or QApplication([])
+
+def read_file(*parts):
+    """Return the text content of a file."""
+    with open(os.path.join(*parts)) as f:
+        return f.read()
+
+def test_images_category(config):
+    """Test file categories."""
     assert "Images" in config.file_categories
     assert ".jpg" in config.file_categories["Images"]
-    
-    # Test UI settings
+
+def test_ui_settings(config):
+    """Test UI settings."""
     assert "window_width" in config.ui_settings
     assert config.ui_settings["window_width"] == 600
+
+def test_config_round_trip(scratch_dir):
+    """Test that an added category is saved and loaded back as a frozenset."""
+    config_file = os.path.join(scratch_dir, "config.json")
+    Config(config_file).add_category("Ebooks", [".epub", ".mobi"])
     
-    print("✅ Configuration system working correctly")
+    reloaded = Config(config_file)
+    assert reloaded.file_categories["Ebooks"] == frozenset({".epub", ".mobi"})
+    assert all(isinstance(exts, frozenset) for exts in reloaded.file_categories.values())
+    assert reloaded._ext_to_category[".epub"] == "Ebooks"
+    assert reloaded._ext_to_category[".mobi"] == "Ebooks"
+    assert reloaded._ext_to_category[".jpg"] == "Images"
+
+@pytest.mark.parametrize("filename, category", EXPECTED_CATEGORIES)
+def test_extension_category(config, filename, category):
+    """Test that each sample file's extension maps to its category."""
+    ext = os.path.splitext(filename)[1]
+    assert ext in config.file_categories[category]
+    assert config._ext_to_category[ext] == category
 
-def test_logger():
+@pytest.mark.parametrize("filename", TEST_FILES)
+def test_create_test_files(sample_dir, filename):
+    """Test that every sample file is written with its content."""
+    assert read_file(sample_dir, filename) == f"Test content for {filename}"
+
+def test_move_to_category(organizer, scratch_dir):
+    """Test that a file is moved into its category folder."""
+    create_test_files(scratch_dir)
+    
+    assert organizer.organize_file(Path(scratch_dir, "image.jpg"))
+    assert not os.path.exists(os.path.join(scratch_dir, "image.jpg"))
+    assert read_file(scratch_dir, "Images", "image.jpg") == "Test content for image.jpg"
+
+def test_move_name_collision(organizer, scratch_dir):
+    """Test that a name already taken in the category folder gets a counter suffix."""
+    os.mkdir(os.path.join(scratch_dir, "Images"))
+    with open(os.path.join(scratch_dir, "Images", "image.jpg"), "w") as f:
+        f.write("existing")
+    create_test_files(scratch_dir)
+    
+    assert organizer.organize_file(Path(scratch_dir, "image.jpg"))
+    assert sorted(os.listdir(os.path.join(scratch_dir, "Images"))) == ["image.jpg", "image_1.jpg"]
+    assert read_file(scratch_dir, "Images", "image.jpg") == "existing"
+    assert read_file(scratch_dir, "Images", "image_1.jpg") == "Test content for image.jpg"
+
+def test_organize_existing_files_collisions(qapp, scratch_dir, monkeypatch):
+    """Test that concurrent moves racing for the same names never overwrite a file."""
+    # photo.jpg is taken, so moving photo.jpg races photo_1.jpg for photo_1.jpg, etc.
+    os.mkdir(os.path.join(scratch_dir, "Images"))
+    names = ["photo.jpg"] + [f"photo_{i}.jpg" for i in range(1, 33)]
+    with open(os.path.join(scratch_dir, "Images", "photo.jpg"), "w") as f:
+        f.write("existing")
+    for name in names:
+        with open(os.path.join(scratch_dir, name), "w") as f:
+            f.write(name)
+    
+    # The app reads config.json and writes its log in the working directory
+    with tempfile.TemporaryDirectory(dir=TEST_TMP_ROOT) as app_dir:
+        monkeypatch.chdir(app_dir)
+        app = FileOrganizerApp()
+        try:
+            app.source_folder = scratch_dir
+            app.organize_existing_files()
+        finally:
+            app.logger.close()
+    
+    images = os.path.join(scratch_dir, "Images")
+    assert sorted(os.listdir(scratch_dir)) == ["Images"]
+    assert len(os.listdir(images)) == len(names) + 1
+    contents = sorted(read_file(images, name) for name in os.listdir(images))
+    assert contents == sorted(names + ["existing"])
+
+def test_move_after_category_folder_removed(organizer, scratch_dir):
+    """Test that a cached category folder deleted since is created again."""
+    os.rmdir(organizer.get_dest_folder("Images"))
+    create_test_files(scratch_dir)
+    
+    assert organizer.organize_file(Path(scratch_dir, "image.jpg"))
+    assert read_file(scratch_dir, "Images", "image.jpg") == "Test content for image.jpg"
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows moves with a single rename")
+def test_move_unlink_failure_rolls_back(organizer, scratch_dir, monkeypatch):
+    """Test that the new link is removed again when the source cannot be unlinked."""
+    create_test_files(scratch_dir)
+    source = os.path.join(scratch_dir, "image.jpg")
+    real_unlink = os.unlink
+    
+    def unlink(path, *args, **kwargs):
+        if os.fspath(path) == source:
+            raise PermissionError(errno.EPERM, "Operation not permitted", source)
+        real_unlink(path, *args, **kwargs)
+    
+    monkeypatch.setattr(os, "unlink", unlink)
+    
+    assert not organizer.organize_file(Path(source))
+    assert read_file(source) == "Test content for image.jpg"
+    assert os.listdir(os.path.join(scratch_dir, "Images")) == []
+
+def start_monitor(folder, config, logger):
+    """Start a FolderMonitor and wait until its handler is scheduled."""
+    monitor = FolderMonitor(folder, config, logger)
+    started = threading.Event()
+    monitor.monitoring_started.connect(started.set, Qt.ConnectionType.DirectConnection)
+    monitor.start()
+    assert started.wait(5)
+    return monitor
+
+def wait_for(predicate, timeout=5):
+    """Poll predicate until it holds or timeout seconds pass."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+def test_monitors_sharing_folder(qapp, scratch_dir, config, organizer_logger, monkeypatch):
+    """Test that stopping one of two monitors on a folder leaves the other working."""
+    errors = []
+    monkeypatch.setattr(organizer_logger, "error",
+                        lambda message, **kwargs: errors.append(message))
+    first = start_monitor(scratch_dir, config, organizer_logger)
+    second = start_monitor(scratch_dir, config, organizer_logger)
+    stopped = threading.Event()
+    second.monitoring_stopped.connect(stopped.set, Qt.ConnectionType.DirectConnection)
+    
+    first.stop()
+    assert first.wait(5000)
+    
+    with open(os.path.join(scratch_dir, "image.jpg"), "w") as f:
+        f.write("Test content for image.jpg")
+    assert wait_for(lambda: os.path.exists(os.path.join(scratch_dir, "Images", "image.jpg")))
+    
+    second.stop()
+    assert second.wait(5000)
+    assert stopped.is_set()
+    assert not [message for message in errors if message.startswith("Monitor error")]
+
+def test_logger(scratch_dir):
     """Test logging system."""
-    print("Testing logging system...")
-    logger = FileOrganizerLogger("test.log")
+    log_file = os.path.join(scratch_dir, "test.log")
+    logger = FileOrganizerLogger(log_file)
     
     logger.info("Test info message", emit_signal=False)
     logger.success("Test success message", emit_signal=False)
     logger.warning("Test warning message", emit_signal=False)
     logger.error("Test error message", emit_signal=False)
     
+    # Records are only queued on the calling thread; the listener owns the file
+    assert [type(h) for h in logger.logger.handlers] == [QueueHandler]
+    file_handler = logger._listener.handlers[0]
+    assert isinstance(file_handler, RotatingFileHandler)
+    assert file_handler.baseFilename == os.path.abspath(log_file)
+    
     # Check if log file was created
-    assert os.path.exists("test.log")
-    
-    # Close logger handlers to release file
-    for handler in logger.logger.handlers:
-        handler.close()
-    logger.logger.handlers.clear()
-    
-    # Clean up
-    try:
-        os.remove("test.log")
-    except OSError:
-        pass  # File might still be in use, that's okay for testing
-    
-    print("✅ Logging system working correctly")
-
-def main():
-    """Run all tests."""
-    print("Smart File Organizer - Test Suite")
-    print("=" * 40)
-    
-    try:
-        test_config()
-        test_logger()
-        
-        print("\n🎉 All tests passed!")
-        print("The File Organizer is ready to use.")
-        
-    except Exception as e:
-        print(f"\n❌ Test failed: {e}")
-        return 1
-    
-    return 0
+    assert os.path.exists(log_file)
+    
+    # Drain the queue, then release every handler before the directory is removed
+    logger.close()
+    logging.shutdown()
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-q"]))